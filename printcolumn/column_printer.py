@@ -1,5 +1,3 @@
-#!/usr/bin/env python
-
 # PrintColumn
 # Author: Ryan LaPine
 # Version: 0.1.1
@@ -16,13 +14,112 @@ Supports:
 - Custom column and row dividers
 
 Requires:
-- printpop: for styled console output
+- printpop: for the ANSI codes used in styled console output
 """
 
+import io
+import re
+import sys
 import textwrap
-import math
-from typing import List
-from printpop import print_formatted
+from functools import lru_cache
+from itertools import chain, repeat, starmap, zip_longest
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+from printpop.color_printer import ColorPrinter as AnsiCodes
+from .colors import Colors
+
+_ANSI_RESET = AnsiCodes.ANSI_BASE.format(code=AnsiCodes.FORMAT_CODES[AnsiCodes.RESET])
+_ANSI_BOLD = AnsiCodes.ANSI_BASE.format(code=AnsiCodes.FORMAT_CODES[AnsiCodes.BOLD])
+_ANSI_ITALIC = AnsiCodes.ANSI_BASE.format(code=AnsiCodes.FORMAT_CODES[AnsiCodes.ITALIC])
+
+_WHITESPACE_DEL = str.maketrans('', '', ' \t\n\r\x0b\x0c')
+
+
+def _norm(name: str) -> str:
+    """Normalizes a color name for lookup, e.g. 'Light Blue' -> 'lightblue'.
+
+    Args:
+        name (str): Color name as given by the caller.
+
+    Returns:
+        str: The name with all whitespace removed and case folded.
+    """
+    return name.translate(_WHITESPACE_DEL).casefold()
+
+
+# Normalized color name -> ANSI escape sequence, resolved once at import time
+_COLOR_ANSI: Dict[str, str] = {}
+_BACK_COLOR_ANSI: Dict[str, str] = {}
+for _color in Colors:
+    _r, _g, _b = AnsiCodes.COLOR_RGB[_color.value]
+    _COLOR_ANSI[_norm(_color.value)] = AnsiCodes.RGB_FOREGROUND.format(r=_r, g=_g, b=_b)
+    _BACK_COLOR_ANSI[_norm(_color.value)] = AnsiCodes.RGB_BACKGROUND.format(r=_r, g=_g, b=_b)
+del _color, _r, _g, _b
+
+
+# textwrap's replace_whitespace set, mapped to spaces
+_WHITESPACE_TO_SPACE = str.maketrans('\t\n\x0b\x0c\r', '     ')
+
+
+@lru_cache(maxsize=None)
+def _ansi_prefix(color: str, back: str, bold: bool, italic: bool) -> str:
+    """Builds the ANSI prefix printpop would emit for a given style.
+
+    Cached so rows with identical styling only resolve color names once.
+
+    Args:
+        color (str): Normalized text color name (HTML-safe), or '' for none.
+        back (str): Normalized background color name (HTML-safe), or '' for none.
+        bold (bool): Whether the text should be bold.
+        italic (bool): Whether the text should be italic.
+
+    Returns:
+        str: The concatenated ANSI codes, or '' when no styling applies.
+    """
+    codes = []
+    if bold:
+        codes.append(_ANSI_BOLD)
+    if italic:
+        codes.append(_ANSI_ITALIC)
+    codes.append(_COLOR_ANSI.get(color, ''))
+    codes.append(_BACK_COLOR_ANSI.get(back, ''))
+    return ''.join(codes)
+
+
+_NON_SPACE = re.compile(r'[^ ]')
+
+
+@lru_cache(maxsize=32)
+def _wrapper_for(width: int, break_on_hyphens: bool = False) -> textwrap.TextWrapper:
+    """Returns a TextWrapper for the given width, reused across rows.
+
+    Tabs are not expanded, which keeps textwrap on its simplest path. Whitespace is
+    still replaced so embedded tabs and newlines cannot break column alignment.
+
+    Args:
+        width (int): Width to wrap text to.
+        break_on_hyphens (bool): Whether to allow breaks after hyphens.
+
+    Returns:
+        textwrap.TextWrapper: Wrapper configured for column text.
+    """
+    return textwrap.TextWrapper(
+        width=width,
+        break_on_hyphens=break_on_hyphens,
+        expand_tabs=False,
+        drop_whitespace=True
+    )
+
+
+def _escape_format(text: str) -> str:
+    """Escapes braces so literal text can be embedded in a str.format template.
+
+    Args:
+        text (str): Literal text such as a divider character.
+
+    Returns:
+        str: The text with '{' and '}' doubled.
+    """
+    return text.replace('{', '{{').replace('}', '}}')
 
 
 class ColumnPrinter:
@@ -35,12 +132,17 @@ class ColumnPrinter:
         DEFAULT_COL_DIV (str): Default character between columns.
         DEFAULT_ROW_DIV (str): Default character between rows.
         CARRIAGE_RETURN (str): Newline character.
+        LONG_TEXT_FACTOR (int): Multiple of a column's width beyond which text is
+            wrapped by a linear forward scan instead of textwrap.
+        EMIT_BUFFER_SIZE (int): Size in bytes of the output buffer used by emit_rows.
     """
 
     DEFAULT_COL_WIDTH = 20
     DEFAULT_COL_DIV = ' '
     DEFAULT_ROW_DIV = '-'
     CARRIAGE_RETURN = '\n'
+    LONG_TEXT_FACTOR = 4
+    EMIT_BUFFER_SIZE = 65536
 
     col_widths: List[int] = []
     col_text_colors: List[str] = []
@@ -54,21 +156,23 @@ class ColumnPrinter:
     italic: bool = False
     text_color: str = ''
     back_color: str = ''
+    break_on_hyphens: bool = False
 
     def __init__(
         self,
-        col_widths: List[int] = [],
-        col_text_colors: List[str] = [],
-        col_back_colors: List[str] = [],
-        col_bold: List[bool] = [],
-        col_italic: List[bool] = [],
+        col_widths: List[int] = None,
+        col_text_colors: List[str] = None,
+        col_back_colors: List[str] = None,
+        col_bold: List[bool] = None,
+        col_italic: List[bool] = None,
         col_divider_char: str = DEFAULT_COL_DIV,
         row_divider_char: str = DEFAULT_ROW_DIV,
         width: int = DEFAULT_COL_WIDTH,
         bold: bool = False,
         italic: bool = False,
         text_color: str = '',
-        back_color: str = ''
+        back_color: str = '',
+        break_on_hyphens: bool = False
     ) -> None:
         """Initializes a ColumnPrinter instance with optional styling.
 
@@ -85,12 +189,13 @@ class ColumnPrinter:
             italic (bool, optional): Sets italic value for entire row.
             text_color (str, optional): Sets text color for entire row.
             back_color (str, optional): Sets background color for entire row.
+            break_on_hyphens (bool, optional): Allows wrapping after hyphens in compound words.
         """
-        self.col_widths = col_widths
-        self.col_text_colors = col_text_colors
-        self.col_back_colors = col_back_colors
-        self.col_bold = col_bold
-        self.col_italic = col_italic
+        self.col_widths = col_widths if col_widths is not None else []
+        self.col_text_colors = col_text_colors if col_text_colors is not None else []
+        self.col_back_colors = col_back_colors if col_back_colors is not None else []
+        self.col_bold = col_bold if col_bold is not None else []
+        self.col_italic = col_italic if col_italic is not None else []
         self.col_divider_char = col_divider_char
         self.row_divider_char = row_divider_char
         self.width = width
@@ -98,6 +203,8 @@ class ColumnPrinter:
         self.italic = italic
         self.text_color = text_color
         self.back_color = back_color
+        self.break_on_hyphens = break_on_hyphens
+        self._divider_cache: Dict[Tuple[str, int], str] = {}
        
     def print_column_row(
         self,
@@ -119,6 +226,8 @@ class ColumnPrinter:
 
         Each column can be styled individually or inherit default styling from the class.
         Text is wrapped to fit column widths, and rows are printed line-by-line with optional dividers.
+        Words are split on whitespace only, unless the printer was created with
+        break_on_hyphens=True. Tabs and newlines in the text each become a single space.
 
         Args:
             *args: Variable-length list of strings to print as columns.
@@ -138,28 +247,118 @@ class ColumnPrinter:
         Returns:
             None
         """
-        # Fallback to class-level defaults if not provided
-        
-        col_widths = col_widths or self.col_widths[:]
-        col_text_colors = col_text_colors or self.col_text_colors[:]
-        col_back_colors = col_back_colors or self.col_back_colors[:]
-        col_bold = col_bold or self.col_bold[:]
-        col_italic = col_italic or self.col_italic[:]
+        sys.stdout.write(self._format_column_row(
+            *args,
+            col_widths=col_widths,
+            col_text_colors=col_text_colors,
+            col_back_colors=col_back_colors,
+            col_bold=col_bold,
+            col_italic=col_italic,
+            col_divider_char=col_divider_char,
+            row_divider_char=row_divider_char,
+            width=width,
+            bold=bold,
+            italic=italic,
+            text_color=text_color,
+            back_color=back_color,
+        ))
+        sys.stdout.flush()
+
+    def emit_rows(self, rows: Iterable[Sequence[Any]], **kwargs: Any) -> None:
+        """Prints many rows of formatted columns through one buffered writer.
+
+        Rows are written to a buffer wrapped around stdout and flushed once at the end,
+        instead of once per row as print_column_row does.
+
+        Args:
+            rows (Iterable[Sequence[Any]]): Rows to print, each a sequence of column texts.
+            **kwargs: Styling options accepted by print_column_row, applied to every row.
+
+        Returns:
+            None
+        """
+        stdout = sys.stdout
+        raw = getattr(stdout, 'buffer', None)
+        if raw is None:
+            # Not backed by a binary stream (e.g. redirected to StringIO)
+            for row in rows:
+                stdout.write(self._format_column_row(*row, **kwargs))
+            stdout.flush()
+            return
+
+        # Keep ordering with anything already written to stdout
+        stdout.flush()
+        out = io.TextIOWrapper(
+            io.BufferedWriter(raw, buffer_size=self.EMIT_BUFFER_SIZE),
+            encoding=stdout.encoding,
+            errors=stdout.errors,
+            write_through=False
+        )
+        try:
+            for row in rows:
+                out.write(self._format_column_row(*row, **kwargs))
+        finally:
+            # Detaching flushes both layers without closing the real stdout
+            out.detach().detach()
+
+    def _format_column_row(
+        self,
+        *args,
+        col_widths: List[int] = None,
+        col_text_colors: List[str] = None,
+        col_back_colors: List[str] = None,
+        col_bold: List[bool] = None,
+        col_italic: List[bool] = None,
+        col_divider_char: str = None,
+        row_divider_char: str = None,
+        width: int = None,
+        bold: bool = None,
+        italic: bool = None,
+        text_color: str = None,
+        back_color: str = None,
+    ) -> str:
+        """Builds the styled text for a row of columns, including its row divider.
+
+        Args:
+            *args: Variable-length list of strings to print as columns.
+            col_widths (List[int], optional): Widths for each column.
+            col_text_colors (List[str], optional): Text colors per column (HTML-safe).
+            col_back_colors (List[str], optional): Background colors per column.
+            col_bold (List[bool], optional): Bold styling per column.
+            col_italic (List[bool], optional): Italic styling per column.
+            col_divider_char (str, optional): Character between columns.
+            row_divider_char (str, optional): Character after each row.
+            width (int, optional): Default column width if not specified.
+            bold (bool, optional): Default bold styling.
+            italic (bool, optional): Default italic styling.
+            text_color (str, optional): Default text color.
+            back_color (str, optional): Default background color.
+
+        Returns:
+            str: Every wrapped, styled line of the row followed by the row divider.
+        """
+        # Fallback to instance defaults if not provided. Lists are shared, not copied;
+        # they are only replaced (never mutated) when extended below.
+        col_widths = col_widths if col_widths is not None else self.col_widths
+        col_text_colors = col_text_colors if col_text_colors is not None else self.col_text_colors
+        col_back_colors = col_back_colors if col_back_colors is not None else self.col_back_colors
+        col_bold = col_bold if col_bold is not None else self.col_bold
+        col_italic = col_italic if col_italic is not None else self.col_italic
         if col_divider_char is None:
-            col_divider_char = self.col_divider_char[:]
+            col_divider_char = self.col_divider_char
         if row_divider_char is None:
-            row_divider_char = self.row_divider_char[:]
+            row_divider_char = self.row_divider_char
         
         width = width or self.width
         bold = bold if bold is not None else self.bold
         italic = italic if italic is not None else self.italic
-        text_color = (text_color or self.text_color[:]).replace(' ', '')
-        back_color = (back_color or self.back_color[:]).replace(' ', '')
+        text_color = _norm(text_color or self.text_color)
+        back_color = _norm(back_color or self.back_color)
 
         # Normalize inputs to lists
         col_widths = [col_widths] if isinstance(col_widths, int) else col_widths
-        col_text_colors = [c.replace(' ', '') for c in col_text_colors] if isinstance(col_text_colors, list) else [col_text_colors.replace(' ', '')]
-        col_back_colors = [c.replace(' ', '') for c in col_back_colors] if isinstance(col_back_colors, list) else [col_back_colors.replace(' ', '')]
+        col_text_colors = [_norm(c) for c in col_text_colors] if isinstance(col_text_colors, list) else [_norm(col_text_colors)]
+        col_back_colors = [_norm(c) for c in col_back_colors] if isinstance(col_back_colors, list) else [_norm(col_back_colors)]
         col_bold = [col_bold] if isinstance(col_bold, bool) else col_bold
         col_italic = [col_italic] if isinstance(col_italic, bool) else col_italic
         args = list(args) if args else ['']
@@ -167,31 +366,40 @@ class ColumnPrinter:
         # Extend styling lists to match number of columns
         # if col_widths less than arg fill will width if col_widths greater than args add blank args
         if len(col_widths) < len(args):
-            col_widths += [width] * (len(args) - len(col_widths))
+            col_widths = list(chain(col_widths, repeat(width, len(args) - len(col_widths))))
         elif len(args) < len(col_widths):
-            args += [''] * (len(col_widths) - len(args))
+            args.extend(repeat('', len(col_widths) - len(args)))
 
         num_cols = len(args)
-        col_bold += [bold] * (num_cols - len(col_bold))
-        col_italic += [italic] * (num_cols - len(col_italic))
-        col_text_colors += [text_color] * (num_cols - len(col_text_colors))
-        col_back_colors += [back_color] * (num_cols - len(col_back_colors))
-
-        columns = self._wrap_columns(args=args,
-                                     col_widths=col_widths,
-                                     col_divider_char=col_divider_char)
-        self._print_columns(columns,
-                            col_widths,
-                            col_text_colors,
-                            col_back_colors,
-                            col_bold,
-                            col_italic,
-                            col_divider_char
-                            )
-        # Print row divider
+        if len(col_bold) < num_cols:
+            col_bold = list(chain(col_bold, repeat(bold, num_cols - len(col_bold))))
+        if len(col_italic) < num_cols:
+            col_italic = list(chain(col_italic, repeat(italic, num_cols - len(col_italic))))
+        # Color lists are freshly built by the normalization above, so extend in place
+        col_text_colors.extend(repeat(text_color, max(0, num_cols - len(col_text_colors))))
+        col_back_colors.extend(repeat(back_color, max(0, num_cols - len(col_back_colors))))
+
+        # Resolve styling to ANSI codes once per column rather than once per line
+        col_prefixes = [
+            _ansi_prefix(col_text_colors[i], col_back_colors[i], col_bold[i], col_italic[i])
+            for i in range(num_cols)
+        ]
+        col_suffixes = [_ANSI_RESET if prefix else '' for prefix in col_prefixes]
+        col_dividers = []
+        for i in range(num_cols - 1):
+            divider_prefix = _ansi_prefix('', col_back_colors[i], False, False)
+            divider_suffix = _ANSI_RESET if divider_prefix else ''
+            col_dividers.append(divider_prefix + col_divider_char + divider_suffix)
+
+        row_format = self._build_row_format(col_widths,
+                                            col_prefixes,
+                                            col_suffixes,
+                                            col_dividers
+                                            )
         row_length = self._get_row_length(col_widths=col_widths, col_divider_char=col_divider_char)
-        
-        self._print_row_divider(row_divider_char=row_divider_char, row_length=row_length)
+        row_divider = self._get_row_divider(row_divider_char=row_divider_char, row_length=row_length)
+
+        return self._render_row(args, col_widths, row_format, row_divider)
      
     
     def _get_row_length(self, 
@@ -211,103 +419,201 @@ class ColumnPrinter:
         row_length += len(col_divider_char) * (len(col_widths) - 1)
         return row_length
 
-    def _wrap_columns(
+    def _wrap_column(
+        self,
+        text: str,
+        wrap_width: int
+        ) -> List[str]:
+        """Wraps a single column's text to fit within its width.
+
+        Words are split on whitespace only unless break_on_hyphens is set.
+
+        Args:
+            text (str): Text for the column.
+            wrap_width (int): Maximum width of the column.
+
+        Returns:
+            List[str]: The wrapped lines, or a single empty line for blank text.
+        """
+        if not self.break_on_hyphens and len(text) > self.LONG_TEXT_FACTOR * wrap_width:
+            # textwrap degrades badly on long text (URLs, base64 blobs, logs).
+            # The scan only breaks on whitespace, so hyphen breaking stays on textwrap.
+            return self._chunked_wrap(text, wrap_width) or ['']
+        return _wrapper_for(wrap_width, self.break_on_hyphens).wrap(text) or ['']
+
+    def _chunked_wrap(self, text: str, width: int) -> List[str]:
+        """Wraps text in linear time by jumping a full line width ahead at a time.
+
+        Console characters are fixed width, so each line ends at most width characters
+        past its start. The break is moved back to the last space inside that window,
+        or the text is cut at the window edge if there is none. A word longer than the
+        width is only scanned once to find its end, so every character is visited a
+        bounded number of times.
+
+        Args:
+            text (str): Text to wrap.
+            width (int): Maximum width of each line.
+
+        Returns:
+            List[str]: The wrapped lines, empty if text is only whitespace.
+
+        Raises:
+            ValueError: If width is not positive.
+        """
+        if width <= 0:
+            raise ValueError("invalid width %r (must be > 0)" % (width,))
+        text = text.translate(_WHITESPACE_TO_SPACE)
+        if ' ' not in text:
+            return [text[i:i + width] for i in range(0, len(text), width)]
+
+        lines = []
+        text_len = len(text)
+        # Like textwrap, keep leading whitespace on the first line, less any whole
+        # widths of it that could never share a line with text
+        indent = text_len - len(text.lstrip(' '))
+        start = indent - (indent - 1) % width - 1 if indent else 0
+        while start < text_len:
+            end = start + width
+            cut = False
+            if end >= text_len:
+                end = text_len
+            elif text[end] != ' ':
+                space = text.rfind(' ', start, end)
+                if space != -1:
+                    # Like textwrap, a word longer than the width is cut to fill
+                    # the current line rather than moved to the next one
+                    word_end = text.find(' ', end)
+                    if word_end == -1:
+                        word_end = text_len
+                    if word_end - space - 1 <= width:
+                        end = space
+                    else:
+                        cut = True
+            line = text[start:end].rstrip(' ')
+            # A cut line is kept even if blank, which only happens when the
+            # first line's indent fills it before a long word
+            if line or cut:
+                lines.append(line)
+            # Drop whitespace at the start of the next line, as textwrap does
+            match = _NON_SPACE.search(text, end)
+            if match is None:
+                break
+            start = match.start()
+        return lines
+
+    def _build_row_format(
         self,
-        args: List[str],
         col_widths: List[int],
-        col_divider_char: str
-        ) -> List[List[str]]:
-        """Wraps each column's text to fit within its specified width.
+        col_prefixes: List[str],
+        col_suffixes: List[str],
+        col_dividers: List[str]
+    ) -> str:
+        """Builds a format string that pads and styles every column of a line at once.
+
+        Each column becomes a left-aligned replacement field of its width, wrapped in
+        its ANSI prefix and suffix and followed by its styled divider, and the line
+        ends with a newline, so a single str.format call produces a complete styled line.
 
         Args:
-            args (List[str]): List of text strings for each column.
-            col_widths (List[int]): List of maximum widths for each column.
-            col_divider_char (str): Character used to separate columns (not used in wrapping logic).
+            col_widths (List[int]): Widths for each column.
+            col_prefixes (List[str]): ANSI style codes to emit before each column's text.
+            col_suffixes (List[str]): ANSI reset codes to emit after each column's text.
+            col_dividers (List[str]): Styled divider placed after each column but the last.
 
         Returns:
-            List[List[str]]: A list where each element is a list of wrapped lines for a column.
+            str: Newline-terminated format string taking one positional argument per column.
         """
-        columns = []
-        for text, wrap_width in zip(args, col_widths):
-            wrapped_lines = textwrap.fill(str(text or ' '), width=wrap_width).split('\n')
-            columns.append(wrapped_lines)
-        return columns
+        parts = []
+        for col_index, col_width in enumerate(col_widths):
+            parts.append(_escape_format(col_prefixes[col_index]))
+            parts.append('{:<%d}' % col_width)
+            parts.append(_escape_format(col_suffixes[col_index]))
+            if col_index < len(col_dividers):
+                parts.append(_escape_format(col_dividers[col_index]))
+        parts.append(self.CARRIAGE_RETURN)
+        return ''.join(parts)
+
+    def _fits_on_one_line(self, texts: List[str], col_widths: List[int]) -> bool:
+        """Checks whether a row can be formatted without wrapping.
+
+        This is the common case: every column fits its width and has no tabs or
+        newlines for textwrap to replace.
 
+        Args:
+            texts (List[str]): Text for each column.
+            col_widths (List[int]): Width of each column.
 
-    def _print_columns(
+        Returns:
+            bool: True if every column's text fits on a single line as is.
+        """
+        return all(len(text) <= wrap_width and text.isprintable()
+                   for text, wrap_width in zip(texts, col_widths))
+
+    def _render_row(
         self,
-        columns: List[List[str]],
+        args: List[str],
         col_widths: List[int],
-        col_text_colors: List[str],
-        col_back_colors: List[str],
-        col_bold: List[bool],
-        col_italic: List[bool],
-        col_divider_char: str
-    ) -> None:
-        """Prints styled columns line-by-line with alignment and dividers.
+        row_format: str,
+        row_divider: str
+    ) -> str:
+        """Wraps and styles columns line-by-line with alignment and dividers.
 
-        Each column is printed with its corresponding width, text color, background color,
-        and font styling. Rows are printed line-by-line, aligned to the tallest column.
-        Columns are separated by a divider character.
+        Rows whose columns all fit on one line are formatted directly. Otherwise each
+        column is wrapped to its width, then wrapped lines are walked side by side
+        in a single pass, aligned to the tallest column. Every line is padded and styled
+        by one call to the precompiled row format. The lines and the row divider are
+        joined into one string so the whole row can be written in one call.
 
         Args:
-            columns (List[List[str]]): A list of columns, where each column is a list of wrapped text lines.
+            args (List[str]): List of text strings for each column.
             col_widths (List[int]): Widths for each column.
-            col_text_colors (List[str]): Text color for each column (e.g., 'red', 'blue').
-            col_back_colors (List[str]): Background color for each column.
-            col_bold (List[bool]): Whether each column's text should be bold.
-            col_italic (List[bool]): Whether each column's text should be italic.
-            col_divider_char (str): Character used to separate columns visually.
+            row_format (str): Format string built by _build_row_format.
+            row_divider (str): Divider text from _get_row_divider, printed after the row.
 
         Returns:
-            None
+            str: The joined lines of the row followed by the row divider.
         """
-        row_count = max(len(col) for col in columns)
-
-        for row_index in range(row_count):
-            for col_index in range(len(columns)):
-                line = columns[col_index][row_index] if row_index < len(columns[col_index]) else ''
-                padded_line = line.ljust(col_widths[col_index])
-                print_formatted(
-                    padded_line,
-                    color=col_text_colors[col_index],
-                    back_color=col_back_colors[col_index],
-                    bold=col_bold[col_index],
-                    italic=col_italic[col_index],
-                    end=''
-                )
-                if col_index < len(columns) - 1:
-                    print_formatted(
-                        col_divider_char,
-                        back_color=col_back_colors[col_index],
-                        end=''
-                    )
-            print()
-
-
-    def _print_row_divider(self, 
-                           row_divider_char: str, 
-                           row_length: int
-                           ) -> None:
-        """Prints a divider line after a row of columns.
-
-        If the divider character is a carriage return, prints a blank line.
-        Otherwise, prints a repeated character string sized to match the row length.
+        texts = [str(text or '') for text in args]
+        if self._fits_on_one_line(texts, col_widths):
+            return row_format.format(*texts) + row_divider
+
+        wrapped = (
+            self._wrap_column(text, wrap_width)
+            for text, wrap_width in zip(texts, col_widths)
+        )
+        # Transpose columns into lines once, then format them sequentially
+        lines = zip_longest(*wrapped, fillvalue='')
+
+        return ''.join(chain(starmap(row_format.format, lines), (row_divider,)))
+
+
+    def _get_row_divider(self, 
+                         row_divider_char: str, 
+                         row_length: int
+                         ) -> str:
+        """Builds the divider line printed after a row of columns.
+
+        If the divider character is a carriage return, the divider is a blank line.
+        Otherwise, it is a repeated character string sized to match the row length.
 
         Args:
             row_divider_char (str): Character used to create the divider line.
-                If set to '\n', a blank line is printed instead.
+                If set to '\n', a blank line is used instead.
             row_length (int): Total width of the row, used to size the divider.
 
         Returns:
-            None
+            str: The newline-terminated divider, or '' if row_divider_char is empty.
         """
         
         if row_divider_char == self.CARRIAGE_RETURN:
-            print()
-        elif len(row_divider_char) > 0:
-            # print 
-            divider = (row_divider_char * math.ceil(row_length / len(row_divider_char)))[:row_length]
-            print(divider)
-                
-
+            return self.CARRIAGE_RETURN
+        if len(row_divider_char) == 0:
+            return ''
+        # Dividers repeat across rows, so build each (char, length) pair only once
+        key = (row_divider_char, row_length)
+        divider = self._divider_cache.get(key)
+        if divider is None:
+            repeats = -(-row_length // len(row_divider_char))
+            divider = (row_divider_char * repeats)[:row_length] + self.CARRIAGE_RETURN
+            self._divider_cache[key] = divider
+        return divider
@@ -17,7 +17,8 @@ Version: 0.1.1
 Date: 2025-08-03
 """
 
-from typing import List, Optional
+import sys
+from typing import Callable, List, Optional
 from .column_printer import ColumnPrinter
 from .colors import Colors
 
@@ -110,6 +111,7 @@ def initialize_column_printer(
     italic: bool = None,
     text_color: str = None,
     back_color: str = None,
+    break_on_hyphens: bool = False,
 ) -> None:
     """Initializes a ColumnPrinter instance with default formatting.
 
@@ -127,6 +129,7 @@ def initialize_column_printer(
         italic: Default italic styling for all columns.
         text_color: Default text color for all columns.
         back_color: Default background color for all columns.
+        break_on_hyphens: Allow wrapping after hyphens in compound words.
     """
     global _column_printer
     _column_printer = ColumnPrinter(
@@ -143,9 +146,34 @@ def initialize_column_printer(
         italic=italic,
         text_color=text_color,
         back_color=back_color,
+        break_on_hyphens=break_on_hyphens,
     )
 
 
+def _get_line_reader() -> Callable[[str], str]:
+    """Returns an input()-like function suited to the current stdin.
+
+    Interactive sessions use input(). When stdin is piped, it is read in one call
+    and lines are served from memory instead of one readline per prompt.
+
+    Returns:
+        Callable[[str], str]: Function taking a prompt and returning the next line.
+    """
+    if sys.stdin.isatty():
+        return input
+
+    lines = iter(sys.stdin.read().splitlines())
+
+    def read_line(prompt: str = '') -> str:
+        sys.stdout.write(prompt)
+        try:
+            return next(lines)
+        except StopIteration:
+            raise EOFError("EOF when reading a line") from None
+
+    return read_line
+
+
 def main() -> None:
     """Console test entry point for PrintColumn functionality."""
     print("\nPrintColumn - for printing wrapped text columns to the console.\n")
@@ -173,22 +201,23 @@ def main() -> None:
     )
 
     print("\nPrintColumn - Custom test")
-    col_count = int(input("How many columns do you want?: "))
+    read_line = _get_line_reader()
+    col_count = int(read_line("How many columns do you want?: "))
     col_text, col_widths = [], []
     col_text_colors, col_back_colors = [], []
     col_bold, col_italic = [], []
 
     for i in range(col_count):
         print(f"Enter values for column {i + 1}")
-        col_text.append(input(f"\tEnter text for column {i + 1}: "))
-        col_widths.append(int(input(f"\tEnter width of column {i + 1}: ")))
-        col_text_colors.append(input(f"\tEnter text color for column {i + 1}: "))
-        col_back_colors.append(input(f"\tEnter background color for column {i + 1}: "))
-        col_bold.append(input(f"\tBold column {i + 1}? (y/n): ").strip().lower() == "y")
-        col_italic.append(input(f"\tItalic column {i + 1}? (y/n): ").strip().lower() == "y")
-
-    div_char = input("Enter a char to divide the columns: ")
-    row_div_char = input("Enter a char to divide rows: ")
+        col_text.append(read_line(f"\tEnter text for column {i + 1}: "))
+        col_widths.append(int(read_line(f"\tEnter width of column {i + 1}: ")))
+        col_text_colors.append(read_line(f"\tEnter text color for column {i + 1}: "))
+        col_back_colors.append(read_line(f"\tEnter background color for column {i + 1}: "))
+        col_bold.append(read_line(f"\tBold column {i + 1}? (y/n): ").strip().lower() == "y")
+        col_italic.append(read_line(f"\tItalic column {i + 1}? (y/n): ").strip().lower() == "y")
+
+    div_char = read_line("Enter a char to divide the columns: ")
+    row_div_char = read_line("Enter a char to divide rows: ")
 
     ColumnPrinter().print_column_row(
         *col_text,
@@ -0,0 +1,225 @@
+"""Tests for printcolumn.column_printer."""
+
+import io
+import random
+import sys
+from contextlib import redirect_stdout
+
+import pytest
+from printpop import print_formatted
+
+from printcolumn.column_printer import ColumnPrinter, _wrapper_for
+
+
+def _printpop_row(texts, widths, colors, backs, bolds, italics, divider):
+    """Prints one unwrapped row cell by cell with printpop, as print_column_row once did."""
+    for index, text in enumerate(texts):
+        print_formatted(
+            text.ljust(widths[index]),
+            color=colors[index].replace(' ', ''),
+            back_color=backs[index].replace(' ', ''),
+            bold=bolds[index],
+            italic=italics[index],
+            end='',
+        )
+        if index < len(texts) - 1:
+            print_formatted(divider, back_color=backs[index].replace(' ', ''), end='')
+    print()
+
+
+def test_styled_row_matches_printpop(capsys):
+    """Per-column styles produce the same bytes as printpop.print_formatted."""
+    texts = ['ab', 'cd', 'ef', 'gh', 'ij', 'kl']
+    widths = [4, 5, 3, 6, 4, 2]
+    colors = ['red\t', 'Light Blue', 'yellow', 'not a color', 'Navy\n', '']
+    backs = ['Navy\n', 'black', 'Dark Green', ' white ', '', 'gold']
+    bolds = [True, False, True, False, False, True]
+    italics = [False, True, True, False, False, True]
+    ColumnPrinter().print_column_row(
+        *texts,
+        col_widths=widths,
+        col_text_colors=colors,
+        col_back_colors=backs,
+        col_bold=bolds,
+        col_italic=italics,
+        col_divider_char=' |',
+        row_divider_char='',
+    )
+    actual = capsys.readouterr().out
+
+    _printpop_row(texts, widths, colors, backs, bolds, italics, ' |')
+    assert actual == capsys.readouterr().out
+
+
+def test_default_colors_match_printpop(capsys):
+    """Default text and back colors resolve the way printpop resolves them."""
+    ColumnPrinter().print_column_row(
+        'ab', 'cd', width=6, text_color='red\t', back_color='Navy\n',
+        bold=True, italic=False, col_divider_char=' | ', row_divider_char='',
+    )
+    actual = capsys.readouterr().out
+
+    _printpop_row(['ab', 'cd'], [6, 6], ['red\t'] * 2, ['Navy\n'] * 2, [True] * 2, [False] * 2, ' | ')
+    assert actual == capsys.readouterr().out
+
+
+def test_long_text_with_newlines_stays_aligned(capsys):
+    """Newlines in long column text become spaces instead of breaking the row."""
+    ColumnPrinter().print_column_row('a\n' + 'x' * 30, 'b', col_widths=[5, 3])
+    assert capsys.readouterr().out.splitlines() == [
+        'a xxx b  ',
+        'xxxxx    ',
+        'xxxxx    ',
+        'xxxxx    ',
+        'xxxxx    ',
+        'xxxxx    ',
+        'xx       ',
+        '---------',
+    ]
+
+
+def test_print_column_row_rejects_zero_width():
+    """A zero column width is reported clearly rather than failing inside range()."""
+    with pytest.raises(ValueError, match="invalid width 0"):
+        ColumnPrinter().print_column_row('abc', col_widths=[0])
+
+
+def test_braces_in_divider_are_literal(capsys):
+    """A divider containing format braces is printed as is on every wrapped line."""
+    ColumnPrinter().print_column_row(
+        'a', 'bb cc', 'c', width=3, col_divider_char='{|}', row_divider_char='='
+    )
+    assert capsys.readouterr().out.splitlines() == [
+        'a  {|}bb {|}c  ',
+        '   {|}cc {|}   ',
+        '=' * 15,
+    ]
+
+
+EMIT_ROWS = [
+    ('Name', 'Description'),
+    ('alpha', 'A fairly long description that needs to wrap over several lines'),
+    ('beta', ''),
+]
+EMIT_STYLE = dict(col_widths=[8, 16], text_color='red', col_divider_char=' |')
+
+
+def _expected_rows(capture):
+    """Prints EMIT_ROWS one at a time and returns the captured output."""
+    printer = ColumnPrinter()
+    for row in EMIT_ROWS:
+        printer.print_column_row(*row, **EMIT_STYLE)
+    return capture.readouterr().out
+
+
+def test_emit_rows_buffered_matches_print_column_row(capfd):
+    """emit_rows through stdout's binary buffer matches repeated print_column_row calls."""
+    expected = _expected_rows(capfd)
+    assert hasattr(sys.stdout, 'buffer')
+
+    print('before')
+    ColumnPrinter().emit_rows(EMIT_ROWS, **EMIT_STYLE)
+    print('after')
+    sys.stdout.flush()
+
+    assert not sys.stdout.closed
+    assert capfd.readouterr().out == 'before\n' + expected + 'after\n'
+
+
+def test_emit_rows_without_binary_buffer_matches_print_column_row(capsys):
+    """emit_rows falls back to plain writes when stdout has no binary buffer."""
+    expected = _expected_rows(capsys)
+    stream = io.StringIO()
+    with redirect_stdout(stream):
+        ColumnPrinter().emit_rows(EMIT_ROWS, **EMIT_STYLE)
+        print('after')
+
+    assert stream.getvalue() == expected + 'after\n'
+
+
+def _textwrap_lines(text, width):
+    """Wraps text with the cached TextWrapper, ignoring padding-only trailing spaces."""
+    return [line.rstrip(' ') for line in _wrapper_for(width).wrap(text)]
+
+
+@pytest.mark.parametrize("text, width", [
+    ("PrintColumn makes it easy to print structured columns in the console.", 8),
+    ("You can customize the number of columns, widths, and divider characters.", 20),
+    ("spaces   inside   here and   more words", 7),
+    ("a" * 200 + " tail", 12),
+    ("ab " + "x" * 40 + " cd", 8),
+    ("short " + "y" * 25 + "  z", 5),
+    ("tabs\tand\nnewlines\r\nmixed \x0b in\x0cto the text", 6),
+    ("line one\n\nline two\t\tend", 4),
+    ("        ab cd ef gh ij kl mn op", 6),
+    ("   " + "w" * 20 + " end", 3),
+    ("\t\t  indented text wraps here", 5),
+])
+def test_chunked_wrap_matches_textwrap(text, width):
+    """The linear scan wraps the same lines textwrap would."""
+    assert ColumnPrinter()._chunked_wrap(text, width) == _textwrap_lines(text, width)
+
+
+@pytest.mark.parametrize("text", ["", " ", "   \t\n  ", "\n"])
+def test_chunked_wrap_whitespace_only(text):
+    """Whitespace-only text produces no lines, as with textwrap."""
+    assert ColumnPrinter()._chunked_wrap(text, 3) == []
+    assert _textwrap_lines(text, 3) == []
+
+
+def test_chunked_wrap_unbroken_text_is_sliced():
+    """Text without whitespace is cut into width-sized chunks."""
+    assert ColumnPrinter()._chunked_wrap("abcdefghij", 4) == ["abcd", "efgh", "ij"]
+
+
+def test_chunked_wrap_random_text_matches_textwrap():
+    """Randomized mixed text, including overlong words and indents, wraps like textwrap."""
+    rng = random.Random(1)
+    printer = ColumnPrinter()
+    for _ in range(2000):
+        width = rng.randint(1, 15)
+        words = [
+            ''.join(rng.choice('abc') for _ in range(rng.randint(1, 3 * width)))
+            for _ in range(rng.randint(0, 30))
+        ]
+        seps = [
+            rng.choice(['', ' ', '  ', '\t', '\n', ' \n ', ' ' * rng.randint(1, 20)])
+            for _ in range(len(words) + 1)
+        ]
+        text = seps[0] + ''.join(word + sep for word, sep in zip(words, seps[1:]))
+        assert printer._chunked_wrap(text, width) == _textwrap_lines(text, width)
+
+
+@pytest.mark.parametrize("width", [0, -3])
+def test_chunked_wrap_rejects_non_positive_width(width):
+    """A non-positive width raises the same kind of error as textwrap."""
+    with pytest.raises(ValueError, match="invalid width"):
+        ColumnPrinter()._chunked_wrap("abc", width)
+
+
+def test_long_text_respects_break_on_hyphens(capsys):
+    """break_on_hyphens still applies once text is long enough to skip textwrap."""
+    printer = ColumnPrinter(width=12, row_divider_char='', break_on_hyphens=True)
+    printer.print_column_row('state-of-the-art well-known ' * 2)
+    lines = [line.rstrip() for line in capsys.readouterr().out.splitlines()]
+    assert lines == ['state-of-', 'the-art', 'well-known'] * 2
+
+
+@pytest.mark.parametrize("args", [
+    ('ab  ', '  ab'),
+    ('a\tb', 'ok'),
+    ('\xa0ab', 'abcd'),
+    ('', ''),
+    (None, 0),
+    ('x',),
+])
+def test_single_line_rows_match_wrapped_output(monkeypatch, capsys, args):
+    """Rows that skip wrapping print exactly what the wrapping path prints."""
+    style = dict(col_widths=[4, 4], text_color='red', col_divider_char='|')
+    printer = ColumnPrinter()
+    printer.print_column_row(*args, **style)
+    fast = capsys.readouterr().out
+
+    monkeypatch.setattr(printer, '_fits_on_one_line', lambda texts, col_widths: False)
+    printer.print_column_row(*args, **style)
+    assert capsys.readouterr().out == fast
@@ -0,0 +1,31 @@
+"""Tests for printcolumn.core."""
+
+import io
+import sys
+
+import pytest
+
+from printcolumn import core
+
+
+def test_line_reader_serves_piped_input(monkeypatch, capsys):
+    """Piped stdin is read once and served line by line, with prompts echoed."""
+    stdin = io.StringIO('first\nsecond\n')
+    monkeypatch.setattr(sys, 'stdin', stdin)
+    read_line = core._get_line_reader()
+    assert stdin.read() == ''
+
+    assert read_line('A: ') == 'first'
+    assert read_line('B: ') == 'second'
+    with pytest.raises(EOFError):
+        read_line('C: ')
+    assert capsys.readouterr().out == 'A: B: C: '
+
+
+def test_initialize_column_printer_defaults_break_on_hyphens_to_false(monkeypatch):
+    """initialize_column_printer passes a real bool for break_on_hyphens by default."""
+    captured = {}
+    monkeypatch.setattr(core, '_column_printer', None)
+    monkeypatch.setattr(core, 'ColumnPrinter', lambda **kwargs: captured.update(kwargs))
+    core.initialize_column_printer()
+    assert captured['break_on_hyphens'] is False